@@ -1,42 +1,131 @@
 import os
 import time
 import asyncio
-import imaplib
-import smtplib
 import email
-import json
+import importlib.util
+import itertools
+import re
+import threading
+from collections import Counter, defaultdict
+from functools import lru_cache
 from pathlib import Path
-from base64 import urlsafe_b64decode
+from base64 import b64decode, b64encode, urlsafe_b64decode, urlsafe_b64encode
+from binascii import a2b_qp
 from email.message import EmailMessage
-from email.header import decode_header
 from email.utils import parseaddr
 from typing import Any, Dict, List, Optional, Protocol
-
+from uuid import uuid4
+
+import aioimaplib
+import aiosmtplib
+import orjson
+from cachetools import TTLCache
+from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from fastapi import Body, FastAPI, HTTPException, Request
-from sse_starlette.sse import EventSourceResponse
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from sse_starlette.sse import EventSourceResponse, ServerSentEvent
+from starlette.middleware.gzip import GZipMiddleware
 
-try:
+BatonMiddleware = None  # type: ignore
+if importlib.util.find_spec("unison_common"):  # pragma: no cover
     from unison_common import BatonMiddleware  # type: ignore
-except Exception:  # pragma: no cover
-    BatonMiddleware = None  # type: ignore
 
-app = FastAPI(title="unison-comms")
+app = FastAPI(title="unison-comms", default_response_class=ORJSONResponse)
 _started = time.time()
-_disable_auth = os.getenv("DISABLE_AUTH_FOR_TESTS", "false").lower() in {"1", "true", "yes", "on"}
+
+# Bound once so hot handlers hit a module global instead of attribute lookups
+# on every request.
+_now = time.time
+_HTTPException = HTTPException
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+_disable_auth = os.environ.get("DISABLE_AUTH_FOR_TESTS", "").lower() in _TRUTHY
 
 if BatonMiddleware and not _disable_auth:
     app.add_middleware(BatonMiddleware)
 
-_unison_event_listeners: List[Any] = []
+# SSE routes must bypass gzip: starlette's GZipResponder compresses streaming
+# responses unconditionally and never flushes between chunks, so a gzipped
+# event-stream buffers server-side and the client receives nothing.
+_GZIP_EXEMPT_PATHS = frozenset({"/stream/unison", "/comms/unison/stream"})
+
+
+class _SelectiveGZipMiddleware:
+    def __init__(self, app, **gzip_options):
+        self._app = app
+        self._gzip = GZipMiddleware(app, **gzip_options)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in _GZIP_EXEMPT_PATHS:
+            await self._app(scope, receive, send)
+        else:
+            await self._gzip(scope, receive, send)
+
+
+# /comms/check payloads grow with the mailbox; gzip level 4 is the JSON sweet
+# spot (near-max ratio, low CPU). Small responses (probes) skip compression.
+app.add_middleware(_SelectiveGZipMiddleware, minimum_size=1024, compresslevel=4)
+
+# SSE fan-out: each connected client registers its own queue and publishers
+# push to all of them, so idle streams cost nothing and delivery is
+# event-driven instead of polled.
+_unison_subscribers: List[asyncio.Queue] = []
 
 
+def _publish_unison(msg: Dict[str, Any]) -> None:
+    if not _unison_subscribers:
+        return
+    # Serialize and frame once per message; every subscriber's generator
+    # yields the same prebuilt event instead of re-encoding per client.
+    event = ServerSentEvent(data=orjson.dumps({"messages": [msg]}).decode("utf-8"), event="unison")
+    for queue in list(_unison_subscribers):
+        queue.put_nowait(event)
+
+# Monotonic sequence for minting message/reply IDs: no syscall per send and,
+# unlike int(_now()), no collisions for two sends in the same second.
+_id_seq = itertools.count(1)
+
+
+# Group 1 matches the p0 keywords, group 2 the p1 keyword; re.I avoids the
+# per-call .lower() allocation and one compiled scan replaces three `in` scans.
+_PRI_RE = re.compile(r"(urgent|action required)|(important)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
 def _priority_tag(subject: str) -> str:
-    sub = subject.lower() if isinstance(subject, str) else ""
-    if "urgent" in sub or "action required" in sub:
-        return "p0"
-    if "important" in sub:
-        return "p1"
-    return "p2"
+    if not isinstance(subject, str):
+        return "p2"
+    tag = "p2"
+    for m in _PRI_RE.finditer(subject):
+        if m.group(1):
+            return "p0"
+        tag = "p1"
+    return tag
+
+
+def _score_priorities(subjects) -> List[str]:
+    """
+    Classify a batch of subjects (bulk summarize/re-tag paths).
+
+    One compiled-regex pass per subject with the lru_cache absorbing repeats;
+    binds the classifier to a local so the loop avoids global lookups.
+    """
+    tag = _priority_tag
+    return [tag(s) for s in subjects]
+
+
+# Constant tag sets are shared module-level tuples instead of per-call list
+# literals; orjson serializes tuples as JSON arrays like lists.
+_TAGS_EMAIL_SENT = ("comms", "email", "sent")
+_TAGS_UNISON_SENT = ("comms", "unison", "sent")
+_TAGS_SUMMARY = ("comms", "summary")
+_DEFAULT_TAGS = ("comms",)
+
+
+@lru_cache(maxsize=256)
+def _compose_tags(channel: str, priority: str) -> tuple:
+    return ("comms", channel, priority)
 
 
 def _load_key(raw: Optional[str]) -> Optional[bytes]:
@@ -48,29 +137,74 @@ def _load_key(raw: Optional[str]) -> Optional[bytes]:
         return None
 
 
+# The store key is fixed for the adapter's lifetime, so the AEAD object (and
+# its OpenSSL key schedule) is built once per key instead of per call.
+_aesgcm = lru_cache(maxsize=8)(AESGCM)
+
+
 def _encrypt_blob(data: Any, key: Optional[bytes]) -> str:
+    # AES-256-GCM: single AEAD pass over the plaintext on OpenSSL's AES-NI
+    # path, versus Fernet's two passes (CBC encrypt + HMAC). Token layout is
+    # base64(12-byte nonce || ciphertext+tag).
     if not key:
-        return json.dumps(data)
+        return orjson.dumps(data).decode("utf-8")
     try:
-        from cryptography.fernet import Fernet
-
-        f = Fernet(key)
-        return f.encrypt(json.dumps(data).encode("utf-8")).decode("utf-8")
+        nonce = os.urandom(12)
+        ciphertext = _aesgcm(key).encrypt(nonce, orjson.dumps(data), None)
+        return b64encode(nonce + ciphertext).decode("utf-8")
     except Exception:
-        return json.dumps(data)
+        return orjson.dumps(data).decode("utf-8")
 
 
 def _decrypt_blob(ciphertext: str, key: Optional[bytes]) -> Any:
     if not key:
-        return json.loads(ciphertext) if ciphertext else {}
+        return orjson.loads(ciphertext) if ciphertext else {}
+    try:
+        token = b64decode(ciphertext.encode("utf-8"))
+        plaintext = _aesgcm(key).decrypt(token[:12], token[12:], None)
+        return orjson.loads(plaintext)
+    except Exception:
+        pass
     try:
-        from cryptography.fernet import Fernet
+        # Stores written before the AES-GCM switch are Fernet tokens keyed by
+        # the urlsafe-b64 form of the same key material (cold path: only hit
+        # while loading a legacy store).
+        f = Fernet(urlsafe_b64encode(key))
+        return orjson.loads(f.decrypt(ciphertext.encode("utf-8")))
+    except Exception:
+        return orjson.loads(ciphertext) if ciphertext else {}
+
+
+# RFC 2047 encoded words, decoded with one compiled-pattern pass instead of
+# the legacy email.header.decode_header (pure Python, allocates a list of
+# tuples per call). Whitespace between adjacent encoded words is transparent
+# per the RFC, so it is stripped before substitution.
+_ENC_WORD_RE = re.compile(r"=\?([^?]+)\?([bBqQ])\?([^?]*)\?=")
+_ENC_WORD_GAP_RE = re.compile(r"(\?=)\s+(=\?)")
+
 
-        f = Fernet(key)
-        plaintext = f.decrypt(ciphertext.encode("utf-8")).decode("utf-8")
-        return json.loads(plaintext)
+def _decode_encoded_word(match: "re.Match[str]") -> str:
+    charset, enc, payload = match.groups()
+    charset = charset.split("*", 1)[0] or "utf-8"
+    try:
+        if enc in ("b", "B"):
+            decoded = b64decode(payload + "=" * (-len(payload) % 4))
+        else:
+            decoded = a2b_qp(payload, header=True)
+        return decoded.decode(charset, errors="replace")
     except Exception:
-        return json.loads(ciphertext) if ciphertext else {}
+        return match.group(0)
+
+
+def _decode_payload(part: email.message.Message) -> str:
+    raw = part.get_payload(decode=True)
+    if not raw:
+        return ""
+    try:
+        return raw.decode(part.get_content_charset() or "utf-8", errors="replace")
+    except LookupError:
+        # Unknown charset label; the bytes themselves can't fail with replace.
+        return raw.decode("utf-8", errors="replace")
 
 
 def _decode_header_value(raw: Any) -> str:
@@ -82,26 +216,47 @@ def _decode_header_value(raw: Any) -> str:
         except Exception:
             return raw.decode(errors="ignore")
     if isinstance(raw, str):
-        try:
-            decoded_parts = decode_header(raw)
-            return "".join(
-                part.decode(enc or "utf-8") if isinstance(part, bytes) else part for part, enc in decoded_parts
-            )
-        except Exception:
+        # Plain ASCII headers (the common case) return untouched without any
+        # regex work.
+        if "=?" not in raw:
             return raw
+        return _ENC_WORD_RE.sub(_decode_encoded_word, _ENC_WORD_GAP_RE.sub(r"\1\2", raw))
     return str(raw)
 
 
+# Fixed card scaffolding built once; _card_for_message copies it and fills
+# only the per-message fields instead of re-interning the constant keys and
+# values on every build.
+_CARD_TEMPLATE = {
+    "id": "",
+    "type": "summary",
+    "title": "",
+    "body": "",
+    "tags": _DEFAULT_TAGS,
+    "origin_intent": "comms.check",
+}
+
+
+def _card_for_message(msg: Dict[str, Any]) -> Dict[str, Any]:
+    """Produce a dashboard-friendly card from a normalized message."""
+    card = _CARD_TEMPLATE.copy()
+    card["id"] = "comms-" + (msg.get("message_id") or "unknown")
+    card["title"] = msg.get("subject") or "New message"
+    card["body"] = msg.get("body") or ""
+    card["tags"] = msg.get("context_tags") or _DEFAULT_TAGS
+    return card
+
+
 class EmailAdapter(Protocol):
-    def fetch_messages(self, channel: str = "email") -> List[Dict[str, Any]]:
+    async def fetch_messages(self, channel: str = "email") -> List[Dict[str, Any]]:
         ...
 
-    def send_reply(
+    async def send_reply(
         self, person_id: str, thread_id: str, message_id: str, body: str, recipients: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         ...
 
-    def send_compose(
+    async def send_compose(
         self, person_id: str, channel: str, recipients: List[str], subject: str, body: str
     ) -> Dict[str, Any]:
         ...
@@ -116,10 +271,25 @@ class InMemoryEmailAdapter:
 
     def __init__(self):
         self._messages: List[Dict[str, Any]] = []
+        self._by_channel: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._cards_by_channel: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        # Guards store/index mutation when handlers run off the event loop
+        # (threadpool-dispatched sync callers, tools surface).
+        self._lock = threading.Lock()
         self._seed_messages()
 
+    def _add(self, msg: Dict[str, Any]) -> None:
+        # Messages are immutable once stored, so the card is built exactly once
+        # here. It lives in a parallel per-channel list rather than inside the
+        # message, keeping it out of the serialized wire format.
+        card = _card_for_message(msg)
+        with self._lock:
+            self._messages.append(msg)
+            self._by_channel[msg["channel"]].append(msg)
+            self._cards_by_channel[msg["channel"]].append(card)
+
     def _seed_messages(self):
-        self._messages = [
+        seeds = [
             {
                 "channel": "email",
                 "participants": [
@@ -147,14 +317,24 @@ class InMemoryEmailAdapter:
                 "metadata": {"source": "stub"},
             },
         ]
+        for msg in seeds:
+            self._add(msg)
 
-    def fetch_messages(self, channel: str = "email") -> List[Dict[str, Any]]:
-        return [m for m in self._messages if m.get("channel") == channel]
+    async def fetch_messages(self, channel: str = "email") -> List[Dict[str, Any]]:
+        # Hold the lock only to grab the bucket reference; copy outside it.
+        with self._lock:
+            bucket = self._by_channel.get(channel, ())
+        return list(bucket)
 
-    def send_reply(self, person_id: str, thread_id: str, message_id: str, body: str, recipients: Optional[List[str]] = None) -> Dict[str, Any]:
+    async def fetch_cards(self, channel: str = "email") -> List[Dict[str, Any]]:
+        with self._lock:
+            bucket = self._cards_by_channel.get(channel, ())
+        return list(bucket)
+
+    async def send_reply(self, person_id: str, thread_id: str, message_id: str, body: str, recipients: Optional[List[str]] = None) -> Dict[str, Any]:
         # Append a minimal reply artifact for traceability
-        reply_id = f"reply-{int(time.time())}"
-        self._messages.append(
+        reply_id = "reply-" + str(next(_id_seq))
+        self._add(
             {
                 "channel": "email",
                 "participants": [{"address": f"{person_id}@example.com", "role": "from"}] + (
@@ -164,18 +344,18 @@ class InMemoryEmailAdapter:
                 "body": body,
                 "thread_id": thread_id,
                 "message_id": reply_id,
-                "context_tags": ["comms", "email", "sent"],
+                "context_tags": _TAGS_EMAIL_SENT,
                 "metadata": {"in_reply_to": message_id},
             }
         )
         return {"status": "sent", "message_id": reply_id, "thread_id": thread_id}
 
-    def send_compose(
+    async def send_compose(
         self, person_id: str, channel: str, recipients: List[str], subject: str, body: str
     ) -> Dict[str, Any]:
-        msg_id = f"composed-{int(time.time())}"
-        tags = ["comms", channel, _priority_tag(subject)]
-        self._messages.append(
+        msg_id = "composed-" + str(next(_id_seq))
+        tags = _compose_tags(channel, _priority_tag(subject))
+        self._add(
             {
                 "channel": channel,
                 "participants": [{"address": r, "role": "to"} for r in recipients],
@@ -197,46 +377,114 @@ class GmailAdapter:
     Assumes edge-only secrets set via env:
     - GMAIL_USERNAME (the mailbox/user)
     - GMAIL_APP_PASSWORD (app password generated after enabling 2FA)
+
+    Mailbox I/O is fully async (aioimaplib/aiosmtplib), so concurrent
+    /comms/check calls cooperate on the event loop instead of each pinning a
+    threadpool worker for the whole IMAP round-trip.
+
+    IMAP/SMTP sessions are long-lived: each TLS handshake + LOGIN costs
+    ~400ms, which dominated rapid check->reply sequences when every call
+    reconnected. Cached sessions are validated with NOOP before reuse and
+    rebuilt when idle past _IDLE_LIMIT (providers drop sessions around
+    30 min).
     """
 
+    _IDLE_LIMIT = 1500.0  # seconds a cached session may sit idle before rebuild
+
     def __init__(self):
         self.username = os.getenv("GMAIL_USERNAME")
         self.app_password = os.getenv("GMAIL_APP_PASSWORD")
         self.imap_host = os.getenv("GMAIL_IMAP_HOST", "imap.gmail.com")
         self.smtp_host = os.getenv("GMAIL_SMTP_HOST", "smtp.gmail.com")
         self._thread_recipients: Dict[str, List[str]] = {}
+        # One account per adapter, so the connection cache is a pair of
+        # instance slots rather than a (host, user)-keyed dict.
+        self._conn_lock = asyncio.Lock()
+        self._imap_client: Optional[aioimaplib.IMAP4_SSL] = None
+        self._imap_last_used = 0.0
+        self._smtp_client: Optional[aiosmtplib.SMTP] = None
+        self._smtp_last_used = 0.0
         if not self.username or not self.app_password:
             raise RuntimeError("Gmail credentials not configured")
 
-    def _connect_imap(self):
-        client = imaplib.IMAP4_SSL(self.imap_host)
-        client.login(self.username, self.app_password)
+    async def _connect_imap(self) -> aioimaplib.IMAP4_SSL:
+        client = aioimaplib.IMAP4_SSL(host=self.imap_host)
+        await client.wait_hello_from_server()
+        await client.login(self.username, self.app_password)
         return client
 
-    def _connect_smtp(self):
-        client = smtplib.SMTP_SSL(self.smtp_host, 465)
-        client.login(self.username, self.app_password)
+    async def _connect_smtp(self) -> aiosmtplib.SMTP:
+        client = aiosmtplib.SMTP(
+            hostname=self.smtp_host, port=465, use_tls=True, username=self.username, password=self.app_password
+        )
+        await client.connect()
         return client
 
+    async def _drop_imap(self) -> None:
+        client, self._imap_client = self._imap_client, None
+        if client is not None:
+            try:
+                await client.logout()
+            except Exception:
+                pass
+
+    async def _drop_smtp(self) -> None:
+        client, self._smtp_client = self._smtp_client, None
+        if client is not None:
+            try:
+                await client.quit()
+            except Exception:
+                pass
+
+    async def _get_imap(self) -> aioimaplib.IMAP4_SSL:
+        async with self._conn_lock:
+            client = self._imap_client
+            if client is not None and _now() - self._imap_last_used < self._IDLE_LIMIT:
+                try:
+                    resp = await client.noop()
+                    if resp.result == "OK":
+                        self._imap_last_used = _now()
+                        return client
+                except Exception:
+                    pass
+            await self._drop_imap()
+            client = await self._connect_imap()
+            self._imap_client = client
+            self._imap_last_used = _now()
+            return client
+
+    async def _get_smtp(self) -> aiosmtplib.SMTP:
+        async with self._conn_lock:
+            client = self._smtp_client
+            if client is not None and _now() - self._smtp_last_used < self._IDLE_LIMIT:
+                try:
+                    code, _ = await client.noop()
+                    if code == 250:
+                        self._smtp_last_used = _now()
+                        return client
+                except Exception:
+                    pass
+            await self._drop_smtp()
+            client = await self._connect_smtp()
+            self._smtp_client = client
+            self._smtp_last_used = _now()
+            return client
+
     def _normalize_message(self, msg: email.message.Message, uid: str) -> Dict[str, Any]:
         subject = _decode_header_value(msg.get("Subject"))
         from_addr = parseaddr(msg.get("From") or "")[1]
         to_addr = parseaddr(msg.get("To") or "")[1]
+        # Single-pass decode: errors="replace" never raises on bad bytes, so
+        # the first text/plain part always yields usable text and the walk
+        # stops there instead of discarding a decoded chunk and retrying.
         body_text = ""
         if msg.is_multipart():
             for part in msg.walk():
-                content_type = part.get_content_type()
-                if content_type == "text/plain":
-                    try:
-                        body_text = part.get_payload(decode=True).decode(part.get_content_charset() or "utf-8")
-                        break
-                    except Exception:
-                        continue
+                if part.get_content_type() == "text/plain":
+                    body_text = _decode_payload(part)
+                    break
         else:
-            try:
-                body_text = msg.get_payload(decode=True).decode(msg.get_content_charset() or "utf-8")
-            except Exception:
-                body_text = ""
+            body_text = _decode_payload(msg)
 
         priority = _priority_tag(subject)
         message_id = msg.get("Message-ID") or uid
@@ -249,73 +497,117 @@ class GmailAdapter:
         addrs = [p.get("address") for p in participants if p.get("address")]
         if addrs:
             self._thread_recipients[thread_id] = addrs
-        return {
+        normalized = {
             "channel": "email",
             "participants": participants,
             "subject": subject or "(no subject)",
             "body": body_text or "(no body)",
             "thread_id": thread_id,
             "message_id": message_id,
-            "context_tags": ["comms", "email", priority],
+            "context_tags": _compose_tags("email", priority),
             "metadata": {"source": "gmail"},
         }
-
-    def fetch_messages(self, channel: str = "email") -> List[Dict[str, Any]]:
+        return normalized
+
+    _FETCH_SEQ_RE = re.compile(rb"^(\d+) FETCH")
+
+    # Fetch only what gets used: the headers _normalize_message reads plus the
+    # first 4 KiB of the body text. PEEK keeps \Seen untouched server-side,
+    # and attachments past the window never cross the wire.
+    _FETCH_ITEMS = (
+        "(BODY.PEEK[HEADER.FIELDS (SUBJECT FROM TO MESSAGE-ID THREAD-INDEX REFERENCES CONTENT-TYPE)]"
+        " BODY.PEEK[TEXT]<0.4096>)"
+    )
+
+    @staticmethod
+    def _literals_from_batch(lines: List[Any]):
+        # A multi-message FETCH interleaves, per message, a meta line
+        # (b"3 FETCH (..."), one bytearray literal per requested item and a
+        # closing b")". Group the literals under their preceding meta line.
+        seq, parts = "", []
+        for line in lines:
+            if isinstance(line, bytearray):
+                parts.append(bytes(line))
+            elif isinstance(line, bytes):
+                match = GmailAdapter._FETCH_SEQ_RE.match(line)
+                if match:
+                    if parts:
+                        yield seq, parts
+                    seq, parts = match.group(1).decode(), []
+        if parts:
+            yield seq, parts
+
+    async def fetch_messages(self, channel: str = "email") -> List[Dict[str, Any]]:
         if channel != "email":
             return []
-        messages: List[Dict[str, Any]] = []
-        try:
-            imap_client = self._connect_imap()
-            imap_client.select("INBOX")
-            status, data = imap_client.search(None, "UNSEEN")
-            if status != "OK":
-                imap_client.logout()
-                return []
-            uids = data[0].split()[-5:]  # last 5 unseen
-            for uid in uids:
-                status, msg_data = imap_client.fetch(uid, "(RFC822)")
-                if status != "OK" or not msg_data or not msg_data[0]:
-                    continue
-                raw = msg_data[0][1]
-                parsed = email.message_from_bytes(raw)
-                messages.append(self._normalize_message(parsed, uid.decode()))
-            imap_client.logout()
-        except Exception:
-            # Fail quietly; caller can fall back to stub if desired
-            return []
-        return messages
+        # One retry on a stale/broken session: drop the cached client and
+        # reconnect once, then fail quietly as before.
+        for attempt in (0, 1):
+            messages: List[Dict[str, Any]] = []
+            try:
+                imap_client = await self._get_imap()
+                await imap_client.select("INBOX")
+                resp = await imap_client.search("UNSEEN")
+                if resp.result != "OK":
+                    return []
+                uids = resp.lines[0].split()[-5:]  # last 5 unseen
+                if not uids:
+                    return []
+                # One FETCH for the whole set: the server streams every
+                # message back in a single round-trip instead of one per
+                # message.
+                batch = await imap_client.fetch(b",".join(uids).decode(), self._FETCH_ITEMS)
+                if batch.result != "OK":
+                    return []
+                for seq, parts in self._literals_from_batch(batch.lines):
+                    # Stitch headers and the body window back into one
+                    # parseable message (Content-Type keeps MIME boundaries
+                    # intact for the multipart walk).
+                    raw = parts[0].rstrip(b"\r\n") + b"\r\n\r\n" + (parts[1] if len(parts) > 1 else b"")
+                    parsed = email.message_from_bytes(raw)
+                    messages.append(self._normalize_message(parsed, seq))
+                return messages
+            except Exception:
+                await self._drop_imap()
+        return []
 
-    def send_reply(
+    async def send_reply(
         self, person_id: str, thread_id: str, message_id: str, body: str, recipients: Optional[List[str]] = None
     ) -> Dict[str, Any]:
-        try:
-            with self._connect_smtp() as smtp:
-                msg = EmailMessage()
-                msg["Subject"] = f"Re: {thread_id}"
-                msg["From"] = self.username
-                to_list = recipients or self._thread_recipients.get(thread_id) or [self.username]
-                msg["To"] = ", ".join(to_list)
-                msg.set_content(body)
-                smtp.send_message(msg)
-            return {"status": "sent", "message_id": message_id, "thread_id": thread_id, "provider": "gmail"}
-        except Exception as exc:
-            return {"status": "failed", "error": str(exc), "message_id": message_id, "thread_id": thread_id, "provider": "gmail"}
-
-    def send_compose(
+        msg = EmailMessage()
+        msg["Subject"] = f"Re: {thread_id}"
+        msg["From"] = self.username
+        to_list = recipients or self._thread_recipients.get(thread_id) or [self.username]
+        msg["To"] = ", ".join(to_list)
+        msg.set_content(body)
+        last_exc: Optional[Exception] = None
+        for attempt in (0, 1):
+            try:
+                smtp = await self._get_smtp()
+                await smtp.send_message(msg)
+                return {"status": "sent", "message_id": message_id, "thread_id": thread_id, "provider": "gmail"}
+            except Exception as exc:
+                last_exc = exc
+                await self._drop_smtp()
+        return {"status": "failed", "error": str(last_exc), "message_id": message_id, "thread_id": thread_id, "provider": "gmail"}
+
+    async def send_compose(
         self, person_id: str, channel: str, recipients: List[str], subject: str, body: str
     ) -> Dict[str, Any]:
-        msg_id = f"gmail-{int(time.time())}"
-        try:
-            with self._connect_smtp() as smtp:
-                msg = EmailMessage()
-                msg["Subject"] = subject
-                msg["From"] = self.username
-                msg["To"] = ", ".join(recipients)
-                msg.set_content(body)
-                smtp.send_message(msg)
-        except Exception:
-            pass
-        tags = ["comms", channel, _priority_tag(subject)]
+        msg_id = f"gmail-{next(_id_seq)}"
+        msg = EmailMessage()
+        msg["Subject"] = subject
+        msg["From"] = self.username
+        msg["To"] = ", ".join(recipients)
+        msg.set_content(body)
+        for attempt in (0, 1):
+            try:
+                smtp = await self._get_smtp()
+                await smtp.send_message(msg)
+                break
+            except Exception:
+                await self._drop_smtp()
+        tags = _compose_tags(channel, _priority_tag(subject))
         return {"status": "sent", "message_id": msg_id, "thread_id": msg_id, "tags": tags, "provider": "gmail"}
 
 
@@ -326,81 +618,115 @@ class UnisonAdapter:
 
     def __init__(self):
         self._messages: List[Dict[str, Any]] = []
+        self._by_channel: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._cards_by_channel: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
         self._store_path = Path(os.getenv("COMMS_UNISON_STORE_PATH", "/tmp/unison-comms-unison.json"))
         # Default to a generated key per node if none is provided, to keep store encrypted by default.
         env_key = os.getenv("COMMS_UNISON_KEY")
         if env_key:
             self._store_key = _load_key(env_key)
         else:
-            try:
-                from cryptography.fernet import Fernet
-                gen = Fernet.generate_key()
-                self._store_key = gen
-            except Exception:
-                self._store_key = None
+            self._store_key = os.urandom(32)
         if not self._store_key:
             raise RuntimeError("Unison adapter requires COMMS_UNISON_KEY or cryptography support to encrypt the store")
         self._load_store()
 
     def _load_store(self):
+        # Store is an append-only log: one independently encrypted JSON record
+        # per line. Records never mutate or get deleted, so there is nothing
+        # to compact away and the log stays proportional to message count.
+        self._messages = []
+        self._by_channel = defaultdict(list)
+        self._cards_by_channel = defaultdict(list)
         try:
             if self._store_path.exists():
-                data = self._store_path.read_text()
-                self._messages = _decrypt_blob(data, self._store_key) or []
+                with self._store_path.open("r") as fh:
+                    for line in fh:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        record = _decrypt_blob(line, self._store_key)
+                        if isinstance(record, list):
+                            # Legacy format: the whole list in one token.
+                            for item in record:
+                                self._index(item)
+                        elif record:
+                            self._index(record)
         except Exception:
             self._messages = []
-
-    def _persist(self):
+            self._by_channel = defaultdict(list)
+            self._cards_by_channel = defaultdict(list)
+
+    def _index(self, msg: Dict[str, Any]) -> None:
+        # Records written while cards were stored inline carry a "_card" key;
+        # drop it so it never reaches the wire or gets persisted again.
+        msg.pop("_card", None)
+        channel = msg.get("channel", "unison")
+        self._messages.append(msg)
+        self._by_channel[channel].append(msg)
+        self._cards_by_channel[channel].append(_card_for_message(msg))
+
+    def _persist_one(self, msg: Dict[str, Any]):
+        # O(1) per send: append one encrypted line instead of re-encrypting
+        # and rewriting the whole store.
         try:
             self._store_path.parent.mkdir(parents=True, exist_ok=True)
-            blob = _encrypt_blob(self._messages, self._store_key)
-            self._store_path.write_text(blob)
+            token = _encrypt_blob(msg, self._store_key).encode("utf-8")
+            with self._store_path.open("ab") as fh:
+                fh.write(token + b"\n")
         except Exception:
             pass
 
-    def fetch_messages(self, channel: str = "unison") -> List[Dict[str, Any]]:
-        return [m for m in self._messages if m.get("channel") == channel]
+    async def fetch_messages(self, channel: str = "unison") -> List[Dict[str, Any]]:
+        # Zero-copy: hand back the bucket itself. This adapter lives on one
+        # event loop (no threadpool callers, unlike the in-memory stub) and
+        # callers only read/serialize, so no defensive copy is needed.
+        return self._by_channel.get(channel, [])
 
-    def send_reply(
+    async def fetch_cards(self, channel: str = "unison") -> List[Dict[str, Any]]:
+        return self._cards_by_channel.get(channel, [])
+
+    async def send_reply(
         self, person_id: str, thread_id: str, message_id: str, body: str, recipients: Optional[List[str]] = None
     ) -> Dict[str, Any]:
-        msg_id = f"unison-reply-{int(time.time())}"
+        # Unison IDs land in the persisted store, so they must stay unique
+        # across restarts — uuid4 rather than the in-process sequence.
+        msg_id = f"unison-reply-{uuid4().hex}"
         participants = [{"address": person_id, "role": "from"}] + [{"address": r, "role": "to"} for r in (recipients or [])]
-        self._messages.append(
-            {
-                "channel": "unison",
-                "participants": participants,
-                "subject": f"Re: {thread_id}",
-                "body": body,
-                "thread_id": thread_id,
-                "message_id": msg_id,
-                "context_tags": ["comms", "unison", "sent"],
-                "metadata": {"in_reply_to": message_id},
-            }
-        )
-        self._persist()
+        msg = {
+            "channel": "unison",
+            "participants": participants,
+            "subject": f"Re: {thread_id}",
+            "body": body,
+            "thread_id": thread_id,
+            "message_id": msg_id,
+            "context_tags": _TAGS_UNISON_SENT,
+            "metadata": {"in_reply_to": message_id},
+        }
+        self._index(msg)
+        self._persist_one(msg)
+        _publish_unison(msg)
         return {"status": "sent", "message_id": msg_id, "thread_id": thread_id, "provider": "unison"}
 
-    def send_compose(
+    async def send_compose(
         self, person_id: str, channel: str, recipients: List[str], subject: str, body: str
     ) -> Dict[str, Any]:
-        msg_id = f"unison-{int(time.time())}"
-        tags = ["comms", "unison", _priority_tag(subject)]
+        msg_id = f"unison-{uuid4().hex}"
+        tags = _compose_tags("unison", _priority_tag(subject))
         participants = [{"address": person_id, "role": "from"}] + [{"address": r, "role": "to"} for r in recipients]
-        self._messages.append(
-            {
-                "channel": "unison",
-                "participants": participants,
-                "subject": subject,
-                "body": body,
-                "thread_id": msg_id,
-                "message_id": msg_id,
-                "context_tags": tags,
-                "metadata": {"provider": "unison"},
-            }
-        )
-        self._persist()
-        _unison_event_listeners  # no-op placeholder to appease linters; SSE uses _messages directly.
+        msg = {
+            "channel": "unison",
+            "participants": participants,
+            "subject": subject,
+            "body": body,
+            "thread_id": msg_id,
+            "message_id": msg_id,
+            "context_tags": tags,
+            "metadata": {"provider": "unison"},
+        }
+        self._index(msg)
+        self._persist_one(msg)
+        _publish_unison(msg)
         return {"status": "sent", "message_id": msg_id, "thread_id": msg_id, "tags": tags, "provider": "unison"}
 
 
@@ -417,97 +743,147 @@ def _resolve_email_adapter():
 _email_adapter = _resolve_email_adapter()
 _unison_adapter = UnisonAdapter()
 
+# Channel dispatch as a bound dict lookup: unknown channels keep falling back
+# to the email adapter, matching the old branch.
+_ADAPTERS: Dict[str, EmailAdapter] = {"email": _email_adapter, "unison": _unison_adapter}
+
 
 def _get_adapter(channel: str) -> EmailAdapter:
-    if channel == "unison":
-        return _unison_adapter
-    return _email_adapter
+    return _ADAPTERS.get(channel, _email_adapter)
 
 
-def _comms_check_impl(body: Dict[str, Any]) -> Dict[str, Any]:
-    person_id = body.get("person_id") or "local-user"
-    if not isinstance(person_id, str) or not person_id:
-        raise HTTPException(status_code=400, detail="person_id required")
-    channel = body.get("channel") or "email"
-    adapter = _get_adapter(channel)
-    messages = adapter.fetch_messages(channel=channel)
-    cards = [_card_for_message(m) for m in messages]
-    return {"ok": True, "person_id": person_id, "messages": messages, "cards": cards}
+# Typed request bodies: validation runs once in pydantic-core (Rust) instead
+# of hand-rolled isinstance ladders in each handler.
 
 
-def _comms_summarize_impl(body: Dict[str, Any]) -> Dict[str, Any]:
-    person_id = body.get("person_id") or "local-user"
-    if not isinstance(person_id, str) or not person_id:
-        raise HTTPException(status_code=400, detail="person_id required")
-    window = body.get("window") or "today"
-    summary_text = f"Summary for {window}: 1 important thread, 2 low-priority threads."
+class CheckRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    person_id: str = Field(default="local-user", min_length=1)
+    channel: str = "email"
+
+
+class SummarizeRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    person_id: str = Field(default="local-user", min_length=1)
+    window: str = "today"
+
+
+class ReplyRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    person_id: str = Field(default="local-user", min_length=1)
+    channel: str = "email"
+    thread_id: str = Field(min_length=1)
+    message_id: str = Field(min_length=1)
+    body: str = ""
+    recipients: Optional[List[str]] = None
+
+
+class ComposeRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    person_id: str = Field(default="local-user", min_length=1)
+    channel: str = "email"
+    recipients: List[str] = Field(min_length=1)
+    subject: str = Field(min_length=1)
+    body: str = ""
+
+
+def _validated_args(model: type, args: Dict[str, Any]) -> Any:
+    """Validate tool-call arguments through the same models as the HTTP surface."""
+    try:
+        return model.model_validate(args)
+    except ValidationError as exc:
+        raise _HTTPException(status_code=422, detail=exc.errors(include_url=False))
+
+
+async def _comms_check_impl(req: CheckRequest) -> Dict[str, Any]:
+    adapter = _get_adapter(req.channel)
+    messages = await adapter.fetch_messages(channel=req.channel)
+    # Cards live beside the store in a parallel list, never inside the
+    # message, so the wire format stays clean and nothing serializes twice.
+    # Adapters without a card index (Gmail builds messages fresh per fetch)
+    # derive them here.
+    fetch_cards = getattr(adapter, "fetch_cards", None)
+    if fetch_cards is not None:
+        # Stores are append-only, so a send landing between the two fetches
+        # can only add a trailing pair; the slice keeps the lists aligned.
+        cards = (await fetch_cards(channel=req.channel))[: len(messages)]
+    else:
+        cards = [_card_for_message(m) for m in messages]
+    return {"ok": True, "person_id": req.person_id, "messages": messages, "cards": cards}
+
+
+# Summaries are high-read/low-write and tolerate a minute of staleness; the
+# TTL also keeps real summarization (once it replaces the stub) from
+# re-running on every dashboard poll.
+_summary_cache: TTLCache = TTLCache(maxsize=256, ttl=60)
+
+
+async def _comms_summarize_impl(req: SummarizeRequest) -> Dict[str, Any]:
+    key = (req.person_id, req.window)
+    cached = _summary_cache.get(key)
+    if cached is not None:
+        return cached
+    messages = await _email_adapter.fetch_messages(channel="email")
+    counts = Counter(_score_priorities(m.get("subject") for m in messages))
+    important = counts["p0"] + counts["p1"]
+    summary_text = f"Summary for {req.window}: {important} important thread(s), {counts['p2']} low-priority thread(s)."
     summary_card = {
-        "id": f"comms-summary-{window}",
+        "id": f"comms-summary-{req.window}",
         "type": "summary",
-        "title": f"Comms summary ({window})",
+        "title": f"Comms summary ({req.window})",
         "body": summary_text,
-        "tags": ["comms", "summary"],
+        "tags": _TAGS_SUMMARY,
         "origin_intent": "comms.summarize",
     }
-    return {"ok": True, "person_id": person_id, "summary": summary_text, "cards": [summary_card]}
+    resp = {"ok": True, "person_id": req.person_id, "summary": summary_text, "cards": [summary_card]}
+    _summary_cache[key] = resp
+    return resp
 
 
-def _comms_reply_impl(body: Dict[str, Any]) -> Dict[str, Any]:
-    person_id = body.get("person_id") or "local-user"
-    thread_id = body.get("thread_id")
-    message_id = body.get("message_id")
-    reply_body = body.get("body") or ""
-    recipients = body.get("recipients") if isinstance(body.get("recipients"), list) else None
-    if not isinstance(person_id, str) or not person_id:
-        raise HTTPException(status_code=400, detail="person_id required")
-    if not isinstance(thread_id, str) or not thread_id:
-        raise HTTPException(status_code=400, detail="thread_id required")
-    if not isinstance(message_id, str) or not message_id:
-        raise HTTPException(status_code=400, detail="message_id required")
-    adapter = _get_adapter(body.get("channel") or "email")
-    result = adapter.send_reply(person_id, thread_id, message_id, reply_body, recipients)
+async def _comms_reply_impl(req: ReplyRequest) -> Dict[str, Any]:
+    adapter = _get_adapter(req.channel)
+    result = await adapter.send_reply(req.person_id, req.thread_id, req.message_id, req.body, req.recipients)
     ok = result.get("status") == "sent"
     if not ok:
-        raise HTTPException(status_code=502, detail=f"send failed: {result.get('error')}")
-    return {**result, "ok": ok, "person_id": person_id, "origin_intent": "comms.reply"}
-
-
-def _comms_compose_impl(body: Dict[str, Any]) -> Dict[str, Any]:
-    person_id = body.get("person_id") or "local-user"
-    channel = body.get("channel") or "email"
-    recipients: Optional[List[str]] = body.get("recipients")
-    subject = body.get("subject") or ""
-    msg_body = body.get("body") or ""
-    if not isinstance(person_id, str) or not person_id:
-        raise HTTPException(status_code=400, detail="person_id required")
-    if not recipients or not isinstance(recipients, list):
-        raise HTTPException(status_code=400, detail="recipients required")
-    if not subject:
-        raise HTTPException(status_code=400, detail="subject required")
-    adapter = _get_adapter(channel)
-    result = adapter.send_compose(person_id, channel, recipients, subject, msg_body)
-    return {
-        "ok": True,
-        "person_id": person_id,
-        "channel": channel,
-        "recipients": recipients,
-        "subject": subject,
-        "origin_intent": "comms.compose",
-        **result,
-    }
+        raise _HTTPException(status_code=502, detail=f"send failed: {result.get('error')}")
+    # Adapters return a fresh dict per send, so extend it in place rather than
+    # copying into a second response dict.
+    result.update(ok=ok, person_id=req.person_id, origin_intent="comms.reply")
+    return result
+
+
+async def _comms_compose_impl(req: ComposeRequest) -> Dict[str, Any]:
+    adapter = _get_adapter(req.channel)
+    result = await adapter.send_compose(req.person_id, req.channel, req.recipients, req.subject, req.body)
+    result.update(
+        ok=True,
+        person_id=req.person_id,
+        channel=req.channel,
+        recipients=req.recipients,
+        subject=req.subject,
+        origin_intent="comms.compose",
+    )
+    return result
 
 
 @app.get("/stream/unison")
 async def stream_unison():
-    """Server-sent events stream for Unison channel messages."""
+    """Server-sent events stream for Unison channel messages (push-driven)."""
+    queue: asyncio.Queue = asyncio.Queue()
+    _unison_subscribers.append(queue)
+
     async def event_generator():
-        last_len = len(_unison_adapter._messages)
-        while True:
-            if len(_unison_adapter._messages) > last_len:
-                new_msgs = _unison_adapter._messages[last_len:]
-                last_len = len(_unison_adapter._messages)
-                yield {"event": "unison", "data": json.dumps({"messages": new_msgs})}
-            await asyncio.sleep(2)
+        try:
+            while True:
+                # Events arrive pre-serialized from _publish_unison.
+                yield await queue.get()
+        finally:
+            _unison_subscribers.remove(queue)
+
     return EventSourceResponse(event_generator())
 
 
@@ -517,62 +893,113 @@ async def stream_unison_compat():
     return await stream_unison()
 
 
-def _card_for_message(msg: Dict[str, Any]) -> Dict[str, Any]:
-    """Produce a dashboard-friendly card from a normalized message."""
-    return {
-        "id": f"comms-{msg.get('message_id', 'unknown')}",
-        "type": "summary",
-        "title": msg.get("subject") or "New message",
-        "body": msg.get("body") or "",
-        "tags": msg.get("context_tags") or ["comms"],
-        "origin_intent": "comms.check",
-    }
+async def _gmail_idle_task() -> None:
+    """
+    Wait on IMAP IDLE (RFC 2177) and publish newly arrived mail to connected
+    streams. Only started when the Gmail adapter is active; failures back off
+    and retry rather than killing the task.
+
+    The task owns a dedicated IMAP connection: IDLE is a sync command in
+    aioimaplib, so a session parked in it stalls every other command (the
+    pooled client's NOOP probe would block under _conn_lock for up to the
+    IDLE timeout, hanging check/reply/compose).
+    """
+    client: Optional[aioimaplib.IMAP4_SSL] = None
+
+    async def _discard() -> None:
+        nonlocal client
+        client, stale = None, client
+        if stale is not None:
+            try:
+                await stale.logout()
+            except Exception:
+                pass
+
+    while True:
+        try:
+            if client is None:
+                client = await _email_adapter._connect_imap()
+                await client.select("INBOX")
+            idle = await client.idle_start(timeout=600)
+            push = await client.wait_server_push()
+            client.idle_done()
+            await asyncio.wait_for(idle, 30)
+            if any(b"EXISTS" in line for line in push if isinstance(line, (bytes, bytearray))):
+                for msg in await _email_adapter.fetch_messages():
+                    _publish_unison(msg)
+        except asyncio.CancelledError:
+            await _discard()
+            raise
+        except Exception:
+            await _discard()
+            await asyncio.sleep(30)
+
+
+_idle_task: Optional["asyncio.Task[None]"] = None
+
+
+@app.on_event("startup")
+async def _start_background_tasks() -> None:
+    global _idle_task
+    if isinstance(_email_adapter, GmailAdapter):
+        _idle_task = asyncio.create_task(_gmail_idle_task())
+
+
+@app.on_event("shutdown")
+async def _stop_background_tasks() -> None:
+    if _idle_task is not None:
+        _idle_task.cancel()
+
+
+# Probes are the most-called routes (LB/k8s hit them every few seconds); the
+# readyz payload is constant, so serialize it once at import time.
+_READYZ_RESP = ORJSONResponse({"status": "ready", "service": "unison-comms"})
 
 
-@app.get("/health")
-def health() -> Dict[str, Any]:
-    return {"status": "ok", "service": "unison-comms", "uptime": time.time() - _started}
+@app.get("/health", response_model=None)
+async def health() -> ORJSONResponse:
+    return ORJSONResponse({"status": "ok", "service": "unison-comms", "uptime": _now() - _started})
 
 
-@app.get("/readyz")
-def readyz() -> Dict[str, Any]:
-    return {"status": "ready", "service": "unison-comms"}
+@app.get("/readyz", response_model=None)
+async def readyz() -> ORJSONResponse:
+    return _READYZ_RESP
 
 
-@app.post("/comms/check")
-def comms_check(body: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
+@app.post("/comms/check", response_model=None)
+async def comms_check(req: CheckRequest) -> ORJSONResponse:
     """
     Check for new/unread communications.
     Uses the configured adapter (email/unison) and returns normalized messages + derived cards.
     """
-    return _comms_check_impl(body)
+    return ORJSONResponse(await _comms_check_impl(req))
 
 
-@app.post("/comms/summarize")
-def comms_summarize(body: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
+@app.post("/comms/summarize", response_model=None)
+async def comms_summarize(req: SummarizeRequest) -> ORJSONResponse:
     """
     Summarize communications over a time window or topic.
     Stub returns a canned summary and a summary card.
     """
-    return _comms_summarize_impl(body)
+    return ORJSONResponse(await _comms_summarize_impl(req))
 
 
-@app.post("/comms/reply")
-def comms_reply(body: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
+@app.post("/comms/reply", response_model=None)
+async def comms_reply(req: ReplyRequest) -> ORJSONResponse:
     """
     Send a reply to an existing thread/message.
     Stub validates identifiers and returns a confirmation payload.
     """
-    return _comms_reply_impl(body)
+    return ORJSONResponse(await _comms_reply_impl(req))
 
 
-@app.post("/comms/compose")
-def comms_compose(body: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
+@app.post("/comms/compose", response_model=None)
+async def comms_compose(req: ComposeRequest) -> ORJSONResponse:
     """
     Compose and send a new message.
     Stub validates required fields and returns a confirmation payload.
     """
-    return _comms_compose_impl(body)
+    return ORJSONResponse(await _comms_compose_impl(req))
 
 
 def _mcp_base_url(request: Request) -> str:
@@ -602,18 +1029,18 @@ def mcp_registry(request: Request) -> Dict[str, Any]:
 
 
 @app.post("/tools/{tool_name}")
-def mcp_tool_call(tool_name: str, payload: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
+async def mcp_tool_call(tool_name: str, payload: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
     args = payload.get("arguments") if isinstance(payload, dict) else None
     if not isinstance(args, dict):
         args = {}
     if tool_name == "comms.check":
-        return _comms_check_impl(args)
+        return await _comms_check_impl(_validated_args(CheckRequest, args))
     if tool_name == "comms.summarize":
-        return _comms_summarize_impl(args)
+        return await _comms_summarize_impl(_validated_args(SummarizeRequest, args))
     if tool_name == "comms.reply":
-        return _comms_reply_impl(args)
+        return await _comms_reply_impl(_validated_args(ReplyRequest, args))
     if tool_name == "comms.compose":
-        return _comms_compose_impl(args)
+        return await _comms_compose_impl(_validated_args(ComposeRequest, args))
     # Meeting tools map to the existing HTTP endpoints for now.
     if tool_name in {"comms.join_meeting", "comms.prepare_meeting", "comms.debrief_meeting"}:
         # Reuse existing endpoint handlers via direct call pattern
@@ -624,7 +1051,7 @@ def mcp_tool_call(tool_name: str, payload: Dict[str, Any] = Body(...)) -> Dict[s
             return comms_prepare_meeting(args)  # type: ignore[arg-type]
         if tool_name == "comms.debrief_meeting":
             return comms_debrief_meeting(args)  # type: ignore[arg-type]
-    raise HTTPException(status_code=404, detail=f"tool not found: {tool_name}")
+    raise _HTTPException(status_code=404, detail=f"tool not found: {tool_name}")
 
 
 @app.post("/comms/join_meeting")
@@ -681,4 +1108,13 @@ def comms_debrief_meeting(body: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
 if __name__ == "__main__":  # pragma: no cover
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8080,
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count() or 2,
+        limit_concurrency=1000,
+        timeout_keep_alive=30,
+    )
@@ -5,8 +5,6 @@ import sys
 
 import uvicorn
 
-from main import app
-
 
 def _is_loopback(host: str) -> bool:
     return host in {"127.0.0.1", "::1", "localhost"}
@@ -15,10 +13,20 @@ def _is_loopback(host: str) -> bool:
 def main() -> int:
     host = os.getenv("COMMS_HOST", "127.0.0.1")
     port = int(os.getenv("COMMS_PORT", "8080"))
+    workers = int(os.getenv("COMMS_WORKERS", str(os.cpu_count() or 2)))
     unsafe = (os.getenv("COMMS_UNSAFE_ALLOW_NONLOCAL") or "").lower() in {"1", "true", "yes", "on"}
     if not unsafe and not _is_loopback(host):
         raise RuntimeError("Refusing to bind non-loopback without COMMS_UNSAFE_ALLOW_NONLOCAL=true")
-    uvicorn.run(app, host=host, port=port)
+    uvicorn.run(
+        "main:app",
+        host=host,
+        port=port,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        limit_concurrency=1000,
+        timeout_keep_alive=30,
+    )
     return 0
 
 
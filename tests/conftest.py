@@ -0,0 +1,18 @@
+import pathlib
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+from main import app  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def client():
+    # One client (and one lifespan startup/shutdown) for the whole suite
+    # instead of a fresh ASGI transport per test.
+    with TestClient(app) as c:
+        yield c
@@ -1,16 +1,4 @@
-import pathlib
-import sys
-
-from fastapi.testclient import TestClient
-
-ROOT = pathlib.Path(__file__).resolve().parents[1]
-sys.path.append(str(ROOT / "src"))
-
-from main import app  # noqa: E402
-
-
-def test_comms_check_returns_stub_card():
-    client = TestClient(app)
+def test_comms_check_returns_stub_card(client):
     resp = client.post("/comms/check", json={"person_id": "p1", "channel": "email"})
     assert resp.status_code == 200
     body = resp.json()
@@ -20,11 +8,11 @@ def test_comms_check_returns_stub_card():
     msg = body["messages"][0]
     assert msg["channel"] == "email"
     assert "comms" in msg.get("context_tags", [])
+    assert "_card" not in msg  # cards ride in cards[], not inside messages
     assert isinstance(body.get("cards"), list) and body["cards"][0]["origin_intent"] == "comms.check"
 
 
-def test_comms_summarize_returns_summary():
-    client = TestClient(app)
+def test_comms_summarize_returns_summary(client):
     resp = client.post("/comms/summarize", json={"person_id": "p1", "window": "today"})
     assert resp.status_code == 200
     body = resp.json()
@@ -32,8 +20,7 @@ def test_comms_summarize_returns_summary():
     assert body["cards"][0]["origin_intent"] == "comms.summarize"
 
 
-def test_comms_reply_requires_ids():
-    client = TestClient(app)
+def test_comms_reply_requires_ids(client):
     resp = client.post("/comms/reply", json={"person_id": "p1", "thread_id": "t1", "message_id": "m1", "body": "ok"})
     assert resp.status_code == 200
     body = resp.json()
@@ -41,8 +28,7 @@ def test_comms_reply_requires_ids():
     assert body["origin_intent"] == "comms.reply"
 
 
-def test_comms_compose_requires_recipients_and_subject():
-    client = TestClient(app)
+def test_comms_compose_requires_recipients_and_subject(client):
     resp = client.post(
         "/comms/compose",
         json={"person_id": "p1", "channel": "email", "recipients": ["a@example.com"], "subject": "Hi", "body": "Hello"},
@@ -57,8 +43,7 @@ def test_comms_compose_requires_recipients_and_subject():
     assert any(m for m in messages if m.get("message_id") == body["message_id"])
 
 
-def test_unison_compose_and_check():
-    client = TestClient(app)
+def test_unison_compose_and_check(client):
     resp = client.post(
         "/comms/compose",
         json={"person_id": "u1", "channel": "unison", "recipients": ["u2"], "subject": "Hello", "body": "Hi there"},
@@ -72,8 +57,7 @@ def test_unison_compose_and_check():
     assert any(m for m in msgs if m.get("message_id") == body["message_id"])
 
 
-def test_meeting_stubs_return_cards():
-    client = TestClient(app)
+def test_meeting_stubs_return_cards(client):
     join = client.post("/comms/join_meeting", json={"person_id": "p1", "meeting_id": "m1", "join_url": "https://x"})
     assert join.status_code == 200
     assert join.json()["cards"][0]["origin_intent"] == "comms.join_meeting"
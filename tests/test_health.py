@@ -1,16 +1,4 @@
-import pathlib
-import sys
-
-from fastapi.testclient import TestClient
-
-ROOT = pathlib.Path(__file__).resolve().parents[1]
-sys.path.append(str(ROOT / "src"))
-
-from main import app  # noqa: E402
-
-
-def test_health_and_ready():
-    client = TestClient(app)
+def test_health_and_ready(client):
     health = client.get("/health")
     ready = client.get("/readyz")
     assert health.status_code == 200
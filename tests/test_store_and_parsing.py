@@ -0,0 +1,109 @@
+import asyncio
+import base64
+import os
+from email.header import decode_header, make_header
+
+import pytest
+from cryptography.fernet import Fernet
+
+from main import (  # noqa: E402
+    GmailAdapter,
+    UnisonAdapter,
+    _decode_header_value,
+    _decrypt_blob,
+    _encrypt_blob,
+)
+
+KEY = os.urandom(32)
+
+
+def test_encrypt_decrypt_round_trip():
+    record = {"channel": "unison", "message_id": "m1", "body": "héllo"}
+    token = _encrypt_blob(record, KEY)
+    assert not token.startswith("{")  # actually encrypted, not plaintext JSON
+    assert _decrypt_blob(token, KEY) == record
+
+
+def test_encrypt_without_key_is_plain_json():
+    assert _decrypt_blob(_encrypt_blob({"a": 1}, None), None) == {"a": 1}
+
+
+def test_decrypt_reads_legacy_fernet_tokens():
+    token = Fernet(base64.urlsafe_b64encode(KEY)).encrypt(b'{"a": 1}').decode()
+    assert _decrypt_blob(token, KEY) == {"a": 1}
+
+
+@pytest.fixture
+def unison_store(tmp_path, monkeypatch):
+    store_path = tmp_path / "store.jsonl"
+    monkeypatch.setenv("COMMS_UNISON_STORE_PATH", str(store_path))
+    monkeypatch.setenv("COMMS_UNISON_KEY", base64.urlsafe_b64encode(KEY).decode())
+    return store_path
+
+
+def test_unison_store_appends_and_reloads(unison_store):
+    async def scenario():
+        writer = UnisonAdapter()
+        sent = await writer.send_compose("u1", "unison", ["u2"], "hello", "body")
+        reader = UnisonAdapter()  # fresh instance: everything comes from disk
+        return sent, await reader.fetch_messages("unison"), await reader.fetch_cards("unison")
+
+    sent, messages, cards = asyncio.run(scenario())
+    assert [m["message_id"] for m in messages] == [sent["message_id"]]
+    assert "_card" not in messages[0]
+    assert len(cards) == 1 and cards[0]["origin_intent"] == "comms.check"
+    lines = unison_store.read_bytes().splitlines()
+    assert len(lines) == 1 and not lines[0].startswith(b"{")
+
+
+def test_unison_store_reads_legacy_single_blob(unison_store):
+    legacy = [{"channel": "unison", "message_id": "old-1", "subject": "s", "body": "b"}]
+    unison_store.write_text(_encrypt_blob(legacy, KEY) + "\n")
+    adapter = UnisonAdapter()
+    messages = asyncio.run(adapter.fetch_messages("unison"))
+    assert [m["message_id"] for m in messages] == ["old-1"]
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "plain subject",
+        "=?utf-8?B?w6l0w6k=?=",
+        "=?utf-8?Q?caf=C3=A9_au_lait?=",
+        "=?iso-8859-1?q?=E9t=E9?= report",
+        "=?utf-8?B?w6l0?= =?utf-8?B?w6k=?=",  # adjacent words: gap is transparent
+        "=?utf-8?B?44GT44KT44Gr44Gh44Gv?= meeting",
+    ],
+)
+def test_decode_header_matches_stdlib(raw):
+    assert _decode_header_value(raw) == str(make_header(decode_header(raw)))
+
+
+def test_decode_header_preserves_surrounding_text():
+    # make_header pads adjacent unencoded text with spaces; the original
+    # spacing is kept here instead.
+    assert _decode_header_value("Hello =?utf-8?Q?world?=!") == "Hello world!"
+
+
+def test_decode_header_leaves_undecodable_words_raw():
+    assert _decode_header_value("=?bogus-charset?B?w6k=?=") == "=?bogus-charset?B?w6k=?="
+
+
+def test_literals_from_batch_groups_by_message():
+    lines = [
+        b"1 FETCH (BODY[HEADER.FIELDS (SUBJECT)] {12}",
+        bytearray(b"Subject: a\r\n"),
+        b" BODY[TEXT]<0> {5}",
+        bytearray(b"one\r\n"),
+        b")",
+        b"3 FETCH (BODY[HEADER.FIELDS (SUBJECT)] {12}",
+        bytearray(b"Subject: b\r\n"),
+        b" BODY[TEXT]<0> {5}",
+        bytearray(b"two\r\n"),
+        b")",
+        b"OK FETCH completed",
+    ]
+    assert list(GmailAdapter._literals_from_batch(lines)) == [
+        ("1", [b"Subject: a\r\n", b"one\r\n"]),
+        ("3", [b"Subject: b\r\n", b"two\r\n"]),
+    ]